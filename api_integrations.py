@@ -1,13 +1,238 @@
+import asyncio
+import functools
+import hashlib
+import random
+import time
+import weakref
+
+import aiohttp
+import orjson
 import requests
-from typing import List, Dict, Any, Optional, Union
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional, Tuple, Union
 import logging
 import os
 from dotenv import load_dotenv
 
+from database import DatabaseManager
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Geocoding results are valid for a day, search responses for an hour
+GEOCODE_TTL = 24 * 3600
+SEARCH_CACHE_TTL = 3600
+
+# Retry policy for rate-limited or failing upstream calls
+MAX_RETRIES = 5
+BACKOFF_INITIAL = 0.5
+BACKOFF_MAX = 8.0
+PROVIDER_CONCURRENCY = 5
+
+# Per-provider concurrency caps, grouped per event loop since semaphores
+# are bound to the loop they were created on. Holding the loop itself in a
+# WeakKeyDictionary lets each loop's semaphores disappear with the loop —
+# keying on id() would leak an entry per asyncio.run call and could hand a
+# recycled id's stale semaphore to a brand-new loop.
+_provider_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def _provider_semaphore(provider: str) -> asyncio.Semaphore:
+    """Semaphore capping concurrent calls to one provider on this loop"""
+    loop = asyncio.get_running_loop()
+    semaphores = _provider_semaphores.get(loop)
+    if semaphores is None:
+        semaphores = _provider_semaphores[loop] = {}
+    semaphore = semaphores.get(provider)
+    if semaphore is None:
+        semaphore = semaphores[provider] = asyncio.Semaphore(PROVIDER_CONCURRENCY)
+    return semaphore
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Exponential backoff with jitter, honoring a Retry-After header if given"""
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    delay = min(BACKOFF_MAX, BACKOFF_INITIAL * (2 ** attempt))
+    return delay * (0.5 + random.random() / 2)
+
+def _request_with_retry(session: requests.Session, method: str, url: str,
+                        provider: str, **kwargs) -> requests.Response:
+    """
+    Issue a request, retrying 429 and 5xx responses with backoff
+
+    Retries prevent transient rate-limit hits from silently turning into
+    empty result sets that the user then re-runs, wasting more quota.
+    """
+    response = None
+    for attempt in range(MAX_RETRIES):
+        response = session.request(method, url, **kwargs)
+        if response.status_code != 429 and response.status_code < 500:
+            return response
+        if attempt == MAX_RETRIES - 1:
+            break
+        delay = _retry_delay(attempt, response.headers.get('Retry-After'))
+        logger.warning(f"Got HTTP {response.status_code} from {provider}, retrying in {delay:.1f}s")
+        time.sleep(delay)
+    return response
+
+async def _fetch_with_retry(session: aiohttp.ClientSession, method: str, url: str,
+                            provider: str, **kwargs) -> bytes:
+    """
+    Async request with per-provider concurrency cap and backoff on 429/5xx
+
+    Returns the raw response body; a final failed attempt raises so the
+    caller's error handling kicks in.
+    """
+    retry_after = None
+    for attempt in range(MAX_RETRIES):
+        async with _provider_semaphore(provider):
+            async with session.request(method, url, **kwargs) as response:
+                if response.status != 429 and response.status < 500:
+                    return await response.read()
+                if attempt == MAX_RETRIES - 1:
+                    response.raise_for_status()
+                retry_after = response.headers.get('Retry-After')
+        delay = _retry_delay(attempt, retry_after)
+        logger.warning(f"Got HTTP 429/5xx from {provider}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+@functools.lru_cache(maxsize=1)
+def _cache_db() -> DatabaseManager:
+    """Database used for the persistent geocode and response caches"""
+    return DatabaseManager()
+
+def _normalize_location(location: str) -> str:
+    """Normalize a location string so cache keys ignore case and spacing"""
+    return ' '.join(location.lower().split())
+
+def _search_cache_key(*parts: Any) -> str:
+    """Build a stable cache key from the identifying parts of a search"""
+    return hashlib.sha1(':'.join(str(part) for part in parts).encode()).hexdigest()
+
+def _search_cache_get(key: str) -> Optional[List[Dict]]:
+    """Return cached search results for a key, or None on miss"""
+    payload = _cache_db().get_cache(key, ttl=SEARCH_CACHE_TTL)
+    if payload is not None:
+        return orjson.loads(payload)
+    return None
+
+def _search_cache_put(key: str, results: List[Dict]):
+    """Store non-empty search results under a cache key"""
+    if results:
+        _cache_db().set_cache(key, orjson.dumps(results))
+
+def _pooled_session() -> requests.Session:
+    """Build a keep-alive session so repeated calls reuse TCP+TLS connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def _cached_search(api_name: str):
+    """
+    Cache search_businesses results in SQLite keyed on (api, query, location, radius)
+
+    A cache hit turns a whole upstream HTTP round trip into a local read.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, query, location, radius=5000, **kwargs):
+            key = _search_cache_key(api_name, query, _normalize_location(location), radius)
+            cached = _search_cache_get(key)
+            if cached is not None:
+                return cached
+            results = func(self, query, location, radius, **kwargs)
+            _search_cache_put(key, results)
+            return results
+        return wrapper
+    return decorator
+
+# Field schemas for the provider result extractors. A tuple is a .get path
+# into the source dict with the default as its last element; a string is a
+# raw expression over the source dict `p`. 'Location.*' entries are grouped
+# into the nested Location dict and 'Business Type' is always the query.
+GOOGLE_PLACE_SCHEMA = {
+    'Business Name': ('displayName', 'text', ''),
+    'Address': ('formattedAddress', ''),
+    'Phone': ('internationalPhoneNumber', ''),
+    'Rating': ('rating', 0.0),
+    'Review Count': ('userRatingCount', 0),
+    'Website': ('websiteUri', ''),
+    'Location.lat': ('location', 'latitude', 0),
+    'Location.lng': ('location', 'longitude', 0),
+}
+
+HERE_ITEM_SCHEMA = {
+    'Business Name': ('title', ''),
+    'Address': ('address', 'label', ''),
+    'Phone': "((p.get('contacts') or [{}])[0].get('phone') or [{}])[0].get('value', '')",
+    'Website': "((p.get('contacts') or [{}])[0].get('www') or [{}])[0].get('value', '')",
+    'Location.lat': ('position', 'lat', 0),
+    'Location.lng': ('position', 'lng', 0),
+    'Rating': "0.0",  # HERE API doesn't provide ratings
+    'Reviews': "0",   # HERE API doesn't provide review counts
+    'Categories': "[cat.get('name', '') for cat in p.get('categories', ())]",
+    'Distance': ('distance', 0),
+    'Source': "'HERE'",
+}
+
+YELP_BUSINESS_SCHEMA = {
+    'Business Name': ('name', ''),
+    'Address': "' '.join((p.get('location') or {}).get('display_address', ()))",
+    'Phone': ('phone', ''),
+    'Rating': ('rating', 0.0),
+    'Review Count': ('review_count', 0),
+    'Website': ('url', ''),
+    'Location.lat': ('coordinates', 'latitude', 0),
+    'Location.lng': ('coordinates', 'longitude', 0),
+    'Price': ('price', ''),
+    'Categories': "[cat.get('title') for cat in p.get('categories', ())]",
+    'Source': "'Yelp'",
+}
+
+def _render_field(spec) -> str:
+    """Render one schema entry as a Python expression over the source dict"""
+    if isinstance(spec, str):
+        return spec
+    *path, default = spec
+    expr = 'p'
+    for key in path[:-1]:
+        expr = f"({expr}.get({key!r}) or {{}})"
+    return f"{expr}.get({path[-1]!r}, {default!r})"
+
+def _build_extractor(name: str, schema: Dict[str, Any]):
+    """
+    Compile a specialized result extractor from a field schema
+
+    The generated function is a flat dict literal of inlined lookups with no
+    schema-driven dispatch at call time; the schema is consulted only here,
+    once, at import. That keeps the per-result cost to plain dict .get calls.
+    """
+    fields = []
+    location_fields = []
+    for out_name, spec in schema.items():
+        expr = _render_field(spec)
+        if out_name.startswith('Location.'):
+            location_fields.append(f"{out_name[len('Location.'):]!r}: {expr}")
+        else:
+            fields.append(f"{out_name!r}: {expr}")
+    fields.append("'Business Type': query")
+    fields.append("'Location': {%s}" % ', '.join(location_fields))
+    source = "def %s(p, query):\n    return {%s}\n" % (name, ', '.join(fields))
+    namespace = {}
+    exec(compile(source, f'<generated {name}>', 'exec'), namespace)
+    return namespace[name]
+
+_format_google_place = _build_extractor('_format_google_place', GOOGLE_PLACE_SCHEMA)
+_format_here_item = _build_extractor('_format_here_item', HERE_ITEM_SCHEMA)
+_format_yelp_business = _build_extractor('_format_yelp_business', YELP_BUSINESS_SCHEMA)
+
 class GooglePlacesAPI:
     def __init__(self):
         self.api_key = os.getenv('GOOGLE_API_KEY')
@@ -15,38 +240,74 @@ class GooglePlacesAPI:
             raise ValueError("Google API key not found in environment variables")
         
         self.base_url = "https://places.googleapis.com/v1/places"
-    
-    def search_businesses(self, query: str, location: str, radius: int = 5000) -> List[Dict]:
+        self.session = _pooled_session()
+
+    def close(self):
+        """Close the pooled HTTP session"""
+        self.session.close()
+
+    @functools.lru_cache(maxsize=1024)
+    def _geocode(self, location: str) -> Optional[Tuple[float, float]]:
         """
-        Search for businesses using Google Places API
-        
+        Geocode a location string to (lat, lng), with in-memory and on-disk caching
+
         Args:
-            query: Search term (e.g., "restaurants", "coffee shops")
             location: Location string (e.g., "New York, NY")
-            radius: Search radius in meters (default 5000)
-            
+
         Returns:
-            List of business data dictionaries
+            Tuple of (lat, lng) or None if the location could not be geocoded
         """
         try:
-            # First, geocode the location
-            geocode_url = f"https://maps.googleapis.com/maps/api/geocode/json"
+            key = _normalize_location(location)
+            cached = _cache_db().get_geocode(key, ttl=GEOCODE_TTL)
+            if cached is not None:
+                return cached
+
+            geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
             params = {
                 'address': location,
                 'key': self.api_key
             }
-            
-            geocode_response = requests.get(geocode_url, params=params)
-            geocode_data = geocode_response.json()
-            
+
+            geocode_response = _request_with_retry(self.session, 'GET', geocode_url,
+                                                  'google', params=params)
+            geocode_data = orjson.loads(geocode_response.content)
+
             if not geocode_data.get('results'):
                 logger.error(f"Could not geocode location: {location}")
-                return []
-            
-            # Get coordinates from geocoding result
+                return None
+
             location_data = geocode_data['results'][0]['geometry']['location']
             lat, lng = location_data['lat'], location_data['lng']
-            
+            _cache_db().set_geocode(key, lat, lng)
+            return lat, lng
+
+        except Exception as e:
+            logger.error(f"Error geocoding location: {str(e)}")
+            return None
+
+    @_cached_search('google')
+    def search_businesses(self, query: str, location: str, radius: int = 5000,
+                          coords: Optional[Tuple[float, float]] = None) -> List[Dict]:
+        """
+        Search for businesses using Google Places API
+
+        Args:
+            query: Search term (e.g., "restaurants", "coffee shops")
+            location: Location string (e.g., "New York, NY")
+            radius: Search radius in meters (default 5000)
+            coords: Pre-geocoded (lat, lng) for the location, if already known
+
+        Returns:
+            List of business data dictionaries
+        """
+        try:
+            if coords is None:
+                coords = self._geocode(location)
+                if coords is None:
+                    return []
+            lat, lng = coords
+
             # Search for businesses
             headers = {
                 'Content-Type': 'application/json',
@@ -65,33 +326,72 @@ class GooglePlacesAPI:
                 'maxResultCount': 20
             }
             
-            response = requests.post(f"{self.base_url}:searchText", headers=headers, json=data)
-            places_data = response.json()
+            response = _request_with_retry(self.session, 'POST', f"{self.base_url}:searchText",
+                                           'google', headers=headers, json=data)
+            places_data = orjson.loads(response.content)
             
             # Process and format the results
-            businesses = []
-            for place in places_data.get('places', []):
-                business_data = {
-                    'Business Name': place.get('displayName', {}).get('text', ''),
-                    'Address': place.get('formattedAddress', ''),
-                    'Phone': place.get('internationalPhoneNumber', ''),
-                    'Rating': place.get('rating', 0.0),
-                    'Review Count': place.get('userRatingCount', 0),
-                    'Website': place.get('websiteUri', ''),
-                    'Business Type': query,
-                    'Location': {
-                        'lat': place.get('location', {}).get('latitude', 0),
-                        'lng': place.get('location', {}).get('longitude', 0)
-                    }
-                }
-                businesses.append(business_data)
-            
+            businesses = [_format_google_place(place, query)
+                          for place in places_data.get('places', ())]
+
             return businesses
             
         except Exception as e:
             logger.error(f"Error searching businesses: {str(e)}")
             return []
-    
+
+    async def search_businesses_async(self, session: aiohttp.ClientSession, query: str,
+                                      lat: float, lng: float, radius: int = 5000) -> List[Dict]:
+        """
+        Async variant of search_businesses using pre-geocoded coordinates
+
+        Args:
+            session: Shared aiohttp client session
+            query: Search term (e.g., "restaurants", "coffee shops")
+            lat: Latitude of the search center
+            lng: Longitude of the search center
+            radius: Search radius in meters (default 5000)
+
+        Returns:
+            List of business data dictionaries
+        """
+        try:
+            cache_key = _search_cache_key('google', query, round(lat, 4), round(lng, 4), radius)
+            cached = _search_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            headers = {
+                'Content-Type': 'application/json',
+                'X-Goog-Api-Key': self.api_key,
+                'X-Goog-FieldMask': 'places.displayName,places.formattedAddress,places.internationalPhoneNumber,places.rating,places.userRatingCount,places.websiteUri,places.location'
+            }
+
+            data = {
+                'textQuery': query,
+                'locationBias': {
+                    'circle': {
+                        'center': {'latitude': lat, 'longitude': lng},
+                        'radius': radius
+                    }
+                },
+                'maxResultCount': 20
+            }
+
+            places_data = orjson.loads(await _fetch_with_retry(
+                session, 'POST', f"{self.base_url}:searchText", 'google',
+                headers=headers, json=data))
+
+            businesses = [_format_google_place(place, query)
+                          for place in places_data.get('places', ())]
+
+            _search_cache_put(cache_key, businesses)
+            return businesses
+
+        except Exception as e:
+            logger.error(f"Error searching businesses: {str(e)}")
+            return []
+
     def get_business_details(self, place_id: str) -> Optional[Dict]:
         """
         Get detailed information about a specific business
@@ -108,8 +408,9 @@ class GooglePlacesAPI:
                 'X-Goog-FieldMask': '*'
             }
             
-            response = requests.get(f"{self.base_url}/{place_id}", headers=headers)
-            data = response.json()
+            response = _request_with_retry(self.session, 'GET', f"{self.base_url}/{place_id}",
+                                           'google', headers=headers)
+            data = orjson.loads(response.content)
             
             details = {
                 'Business Name': data.get('displayName', {}).get('text', ''),
@@ -137,38 +438,74 @@ class HerePlacesAPI:
             raise ValueError("HERE API key not found in environment variables")
         
         self.base_url = "https://discover.search.hereapi.com/v1"
-    
-    def search_businesses(self, query: str, location: str, radius: int = 5000) -> List[Dict]:
+        self.session = _pooled_session()
+
+    def close(self):
+        """Close the pooled HTTP session"""
+        self.session.close()
+
+    @functools.lru_cache(maxsize=1024)
+    def _geocode(self, location: str) -> Optional[Tuple[float, float]]:
         """
-        Search for businesses using HERE Places API
-        
+        Geocode a location string to (lat, lng), with in-memory and on-disk caching
+
         Args:
-            query: Search term (e.g., "restaurants", "coffee shops")
             location: Location string (e.g., "New York, NY")
-            radius: Search radius in meters (default 5000)
-            
+
         Returns:
-            List of business data dictionaries
+            Tuple of (lat, lng) or None if the location could not be geocoded
         """
         try:
-            # First, geocode the location
-            geocode_url = f"https://geocode.search.hereapi.com/v1/geocode"
+            key = _normalize_location(location)
+            cached = _cache_db().get_geocode(key, ttl=GEOCODE_TTL)
+            if cached is not None:
+                return cached
+
+            geocode_url = "https://geocode.search.hereapi.com/v1/geocode"
             params = {
                 'q': location,
                 'apiKey': self.api_key
             }
-            
-            geocode_response = requests.get(geocode_url, params=params)
-            geocode_data = geocode_response.json()
-            
+
+            geocode_response = _request_with_retry(self.session, 'GET', geocode_url,
+                                                  'here', params=params)
+            geocode_data = orjson.loads(geocode_response.content)
+
             if not geocode_data.get('items'):
                 logger.error(f"Could not geocode location: {location}")
-                return []
-            
-            # Get coordinates from geocoding result
+                return None
+
             position = geocode_data['items'][0]['position']
             lat, lng = position['lat'], position['lng']
-            
+            _cache_db().set_geocode(key, lat, lng)
+            return lat, lng
+
+        except Exception as e:
+            logger.error(f"Error geocoding location with HERE API: {str(e)}")
+            return None
+
+    @_cached_search('here')
+    def search_businesses(self, query: str, location: str, radius: int = 5000,
+                          coords: Optional[Tuple[float, float]] = None) -> List[Dict]:
+        """
+        Search for businesses using HERE Places API
+
+        Args:
+            query: Search term (e.g., "restaurants", "coffee shops")
+            location: Location string (e.g., "New York, NY")
+            radius: Search radius in meters (default 5000)
+            coords: Pre-geocoded (lat, lng) for the location, if already known
+
+        Returns:
+            List of business data dictionaries
+        """
+        try:
+            if coords is None:
+                coords = self._geocode(location)
+                if coords is None:
+                    return []
+            lat, lng = coords
+
             # Search for businesses
             search_url = f"{self.base_url}/discover"
             params = {
@@ -179,41 +516,101 @@ class HerePlacesAPI:
                 'radius': radius
             }
             
-            response = requests.get(search_url, params=params)
-            data = response.json()
+            response = _request_with_retry(self.session, 'GET', search_url, 'here', params=params)
+            data = orjson.loads(response.content)
             
             # Process and format the results
-            businesses = []
-            for item in data.get('items', []):
-                # Extract phone and website from contacts if available
-                contacts = item.get('contacts', [{}])[0] if item.get('contacts') else {}
-                phone = contacts.get('phone', [{}])[0].get('value', '') if contacts.get('phone') else ''
-                website = contacts.get('www', [{}])[0].get('value', '') if contacts.get('www') else ''
-                
-                business_data = {
-                    'Business Name': item.get('title', ''),
-                    'Address': item.get('address', {}).get('label', ''),
-                    'Phone': phone,
-                    'Website': website,
-                    'Business Type': query,
-                    'Location': {
-                        'lat': item.get('position', {}).get('lat', 0),
-                        'lng': item.get('position', {}).get('lng', 0)
-                    },
-                    'Rating': 0.0,  # HERE API doesn't provide ratings
-                    'Reviews': 0,    # HERE API doesn't provide review counts
-                    'Categories': [cat.get('name', '') for cat in item.get('categories', [])],
-                    'Distance': item.get('distance', 0),
-                    'Source': 'HERE'
-                }
-                businesses.append(business_data)
-            
+            businesses = [_format_here_item(item, query)
+                          for item in data.get('items', ())]
+
             return businesses
             
         except Exception as e:
             logger.error(f"Error searching businesses with HERE API: {str(e)}")
             return []
-    
+
+    async def geocode_async(self, session: aiohttp.ClientSession, location: str) -> Optional[Tuple[float, float]]:
+        """
+        Geocode a location string to (lat, lng) asynchronously
+
+        Args:
+            session: Shared aiohttp client session
+            location: Location string (e.g., "New York, NY")
+
+        Returns:
+            Tuple of (lat, lng) or None if the location could not be geocoded
+        """
+        try:
+            key = _normalize_location(location)
+            cached = _cache_db().get_geocode(key, ttl=GEOCODE_TTL)
+            if cached is not None:
+                return cached
+
+            geocode_url = "https://geocode.search.hereapi.com/v1/geocode"
+            params = {
+                'q': location,
+                'apiKey': self.api_key
+            }
+
+            geocode_data = orjson.loads(await _fetch_with_retry(
+                session, 'GET', geocode_url, 'here', params=params))
+
+            if not geocode_data.get('items'):
+                logger.error(f"Could not geocode location: {location}")
+                return None
+
+            position = geocode_data['items'][0]['position']
+            lat, lng = position['lat'], position['lng']
+            _cache_db().set_geocode(key, lat, lng)
+            return lat, lng
+
+        except Exception as e:
+            logger.error(f"Error geocoding location with HERE API: {str(e)}")
+            return None
+
+    async def search_businesses_async(self, session: aiohttp.ClientSession, query: str,
+                                      lat: float, lng: float, radius: int = 5000) -> List[Dict]:
+        """
+        Async variant of search_businesses using pre-geocoded coordinates
+
+        Args:
+            session: Shared aiohttp client session
+            query: Search term (e.g., "restaurants", "coffee shops")
+            lat: Latitude of the search center
+            lng: Longitude of the search center
+            radius: Search radius in meters (default 5000)
+
+        Returns:
+            List of business data dictionaries
+        """
+        try:
+            cache_key = _search_cache_key('here', query, round(lat, 4), round(lng, 4), radius)
+            cached = _search_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            search_url = f"{self.base_url}/discover"
+            params = {
+                'apiKey': self.api_key,
+                'q': query,
+                'at': f"{lat},{lng}",
+                'limit': 20,
+                'radius': radius
+            }
+
+            data = orjson.loads(await _fetch_with_retry(
+                session, 'GET', search_url, 'here', params=params))
+
+            businesses = [_format_here_item(item, query)
+                          for item in data.get('items', ())]
+
+            _search_cache_put(cache_key, businesses)
+            return businesses
+
+        except Exception as e:
+            logger.error(f"Error searching businesses with HERE API: {str(e)}")
+            return []
+
     def get_business_details(self, place_id: str) -> Optional[Dict]:
         """
         Get detailed information about a specific business
@@ -231,8 +628,8 @@ class HerePlacesAPI:
                 'id': place_id
             }
             
-            response = requests.get(lookup_url, params=params)
-            data = response.json()
+            response = _request_with_retry(self.session, 'GET', lookup_url, 'here', params=params)
+            data = orjson.loads(response.content)
             
             if not data.get('items'):
                 return None
@@ -268,7 +665,14 @@ class YelpAPI:
             "Authorization": f"Bearer {self.api_key}",
             "accept": "application/json"
         }
-    
+        self.session = _pooled_session()
+
+    def close(self):
+        """Close the pooled HTTP session"""
+        self.session.close()
+
+
+    @_cached_search('yelp')
     def search_businesses(self, query: str, location: str, radius: int = 5000) -> List[Dict]:
         """
         Search for businesses using Yelp API
@@ -290,36 +694,79 @@ class YelpAPI:
                 'limit': 50
             }
             
-            response = requests.get(search_url, headers=self.headers, params=params)
+            response = _request_with_retry(self.session, 'GET', search_url, 'yelp',
+                                           headers=self.headers, params=params)
             response.raise_for_status()
-            data = response.json()
-            
-            businesses = []
-            for business in data.get('businesses', []):
-                business_data = {
-                    'Business Name': business.get('name', ''),
-                    'Address': ' '.join(business.get('location', {}).get('display_address', [])),
-                    'Phone': business.get('phone', ''),
-                    'Rating': business.get('rating', 0.0),
-                    'Review Count': business.get('review_count', 0),
-                    'Website': business.get('url', ''),
-                    'Business Type': query,
-                    'Location': {
-                        'lat': business.get('coordinates', {}).get('latitude', 0),
-                        'lng': business.get('coordinates', {}).get('longitude', 0)
-                    },
-                    'Price': business.get('price', ''),
-                    'Categories': [cat.get('title') for cat in business.get('categories', [])],
-                    'Source': 'Yelp'
-                }
-                businesses.append(business_data)
+            data = orjson.loads(response.content)
             
+            businesses = [_format_yelp_business(business, query)
+                          for business in data.get('businesses', ())]
+
             return businesses
             
         except Exception as e:
             logger.error(f"Error searching businesses with Yelp API: {str(e)}")
             return []
 
+    async def search_businesses_async(self, session: aiohttp.ClientSession, query: str,
+                                      location: str, radius: int = 5000) -> List[Dict]:
+        """
+        Async variant of search_businesses
+
+        Args:
+            session: Shared aiohttp client session
+            query: Search term (e.g., "restaurants", "coffee shops")
+            location: Location string (e.g., "New York, NY")
+            radius: Search radius in meters (default 5000)
+
+        Returns:
+            List of business data dictionaries
+        """
+        try:
+            cache_key = _search_cache_key('yelp', query, _normalize_location(location), radius)
+            cached = _search_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            search_url = f"{self.base_url}/businesses/search"
+            params = {
+                'term': query,
+                'location': location,
+                'radius': radius,
+                'limit': 50
+            }
+
+            data = orjson.loads(await _fetch_with_retry(
+                session, 'GET', search_url, 'yelp',
+                headers=self.headers, params=params))
+
+            businesses = [_format_yelp_business(business, query)
+                          for business in data.get('businesses', ())]
+
+            _search_cache_put(cache_key, businesses)
+            return businesses
+
+        except Exception as e:
+            logger.error(f"Error searching businesses with Yelp API: {str(e)}")
+            return []
+
+@functools.lru_cache(maxsize=8)
+def _get_api(api_type: str, api_key: str):
+    """
+    Return a cached API client for the given type and key
+
+    Caching the clients keeps their pooled HTTP sessions (and geocode
+    memoization) alive across calls and Streamlit reruns. The key is part
+    of the cache key so changing it in the sidebar builds a fresh client.
+    """
+    if api_type == 'google':
+        return GooglePlacesAPI()
+    if api_type == 'here':
+        return HerePlacesAPI()
+    if api_type == 'yelp':
+        return YelpAPI()
+    raise ValueError(f"Unknown API type: {api_type}")
+
 def collect_business_data(api_type: str, business_type: str, location: str) -> List[Dict]:
     """
     Collect business data from selected API source
@@ -336,15 +783,127 @@ def collect_business_data(api_type: str, business_type: str, location: str) -> L
         results = []
         
         if api_type == 'here' and os.getenv('HERE_API_KEY'):
-            api = HerePlacesAPI()
-            results = api.search_businesses(business_type, location)
-            
+            api = _get_api('here', os.getenv('HERE_API_KEY'))
+            # Geocode once up front so repeated searches share the result
+            coords = api._geocode(location)
+            if coords is None:
+                return []
+            results = api.search_businesses(business_type, location, coords=coords)
+
         elif api_type == 'yelp' and os.getenv('YELP_API_KEY'):
-            api = YelpAPI()
+            api = _get_api('yelp', os.getenv('YELP_API_KEY'))
             results = api.search_businesses(business_type, location)
             
         return results
-        
+
+    except Exception as e:
+        logger.error(f"Error collecting business data: {str(e)}")
+        raise
+
+def _relabel_batched_results(results: List[Dict], business_types: List[str]) -> List[Dict]:
+    """
+    Map results of a combined multi-category query back to per-category labels
+
+    Each business is tagged with the first requested category that appears in
+    its provider categories or name; unmatched results keep the primary
+    (first) category.
+    """
+    lowered = [(business_type, business_type.lower()) for business_type in business_types]
+    for business in results:
+        haystack = ' '.join(business.get('Categories') or []).lower()
+        name = business.get('Business Name', '').lower()
+        label = business_types[0]
+        for business_type, business_type_lower in lowered:
+            if business_type_lower in haystack or business_type_lower in name:
+                label = business_type
+                break
+        business['Business Type'] = label
+    return results
+
+def collect_business_data_batched(api_type: str, business_types: List[str], location: str) -> List[Dict]:
+    """
+    Collect business data for several categories in one provider round trip
+
+    Both HERE and Yelp accept combined multi-term queries, so N category
+    searches collapse into a single HTTP call; results are relabeled back to
+    the matching requested category afterwards.
+
+    Args:
+        api_type: Type of API to use ('here' or 'yelp')
+        business_types: List of business categories to search for
+        location: Location to search in
+
+    Returns:
+        Combined list of business data dictionaries across all categories
+    """
+    try:
+        if not business_types:
+            return []
+        if len(business_types) == 1:
+            return collect_business_data(api_type, business_types[0], location)
+
+        if api_type == 'here' and os.getenv('HERE_API_KEY'):
+            api = _get_api('here', os.getenv('HERE_API_KEY'))
+            coords = api._geocode(location)
+            if coords is None:
+                return []
+            results = api.search_businesses(','.join(business_types), location, coords=coords)
+
+        elif api_type == 'yelp' and os.getenv('YELP_API_KEY'):
+            api = _get_api('yelp', os.getenv('YELP_API_KEY'))
+            results = api.search_businesses(' '.join(business_types), location)
+
+        else:
+            return []
+
+        return _relabel_batched_results(results, business_types)
+
+    except Exception as e:
+        logger.error(f"Error collecting business data: {str(e)}")
+        raise
+
+async def collect_business_data_async(api_type: str, business_types: List[str], location: str) -> List[Dict]:
+    """
+    Collect business data for several categories concurrently
+
+    The location is geocoded once and the per-category searches are fired in
+    parallel over a shared keep-alive connection pool, so total wall time is
+    bounded by the slowest single API call instead of the sum of all of them.
+
+    Args:
+        api_type: Type of API to use ('here' or 'yelp')
+        business_types: List of business categories to search for
+        location: Location to search in
+
+    Returns:
+        Combined list of business data dictionaries across all categories
+    """
+    try:
+        connector = aiohttp.TCPConnector(limit=20)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            if api_type == 'here' and os.getenv('HERE_API_KEY'):
+                api = _get_api('here', os.getenv('HERE_API_KEY'))
+                coords = await api.geocode_async(session, location)
+                if coords is None:
+                    return []
+                lat, lng = coords
+                results = await asyncio.gather(*[
+                    api.search_businesses_async(session, business_type, lat, lng)
+                    for business_type in business_types
+                ])
+
+            elif api_type == 'yelp' and os.getenv('YELP_API_KEY'):
+                api = _get_api('yelp', os.getenv('YELP_API_KEY'))
+                results = await asyncio.gather(*[
+                    api.search_businesses_async(session, business_type, location)
+                    for business_type in business_types
+                ])
+
+            else:
+                return []
+
+        return [business for businesses in results for business in businesses]
+
     except Exception as e:
         logger.error(f"Error collecting business data: {str(e)}")
         raise
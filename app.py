@@ -1,9 +1,12 @@
+import io
+import re
+
 import streamlit as st
 import pandas as pd
 from datetime import datetime
 import os
 from dotenv import load_dotenv
-from api_integrations import collect_business_data
+from api_integrations import collect_business_data_batched
 from database import DatabaseManager
 from utils import clean_data, process_data, classify_address
 from visualizations import create_map, create_charts
@@ -12,6 +15,9 @@ import plotly.express as px
 # Load environment variables
 load_dotenv()
 
+# Compiled once; pulls "City, ST" out of a full address
+_CITY_RE = re.compile(r'([\w\s]+,\s*\w{2})')
+
 # Page configuration
 st.set_page_config(page_title="Incubizo Data Profiling", layout="wide")
 st.title("Incubizo Data Profiling")
@@ -23,6 +29,41 @@ def get_database():
 
 db = get_database()
 
+@st.cache_data
+def get_locations(df: pd.DataFrame) -> list:
+    """Sorted unique city/state values, cached until the data changes"""
+    return sorted(df['_CityState'].dropna().unique())
+
+@st.cache_data
+def get_categories(df: pd.DataFrame) -> list:
+    """Sorted unique search categories, cached until the data changes"""
+    return sorted(df['Search Category'].unique())
+
+@st.cache_data
+def get_category_counts(df: pd.DataFrame) -> pd.Series:
+    """Listing counts per search category, cached until the data changes"""
+    counts = df['Search Category'].value_counts()
+    # On a categorical column value_counts reports every category, so a
+    # filtered frame would list deselected categories with a count of 0;
+    # keep only what's actually present, like the object dtype used to
+    return counts[counts > 0]
+
+@st.cache_data
+def category_chart(category_counts: pd.Series):
+    """Horizontal bar chart of listings per category"""
+    fig = px.bar(
+        x=category_counts.values,
+        y=category_counts.index,
+        orientation='h',
+        title="Number of Listings by Category"
+    )
+    fig.update_layout(
+        xaxis_title="Number of Listings",
+        yaxis_title="Category",
+        showlegend=False
+    )
+    return fig
+
 def clear_all():
     """Clear all session state and form values"""
     # Clear all session state
@@ -140,19 +181,15 @@ with st.sidebar:
                         if 'data' in st.session_state:
                             del st.session_state.data
                         
-                        # Collect data for each category
-                        all_results = []
-                        total_categories = len(search_categories)
-                        
                         # Create a progress message
                         progress_text = st.empty()
-                        
-                        for idx, category in enumerate(search_categories, 1):
-                            progress_text.text(f"Searching category {idx}/{total_categories}: {category}")
-                            raw_data = collect_business_data(api_type, category, location)
-                            if raw_data:
-                                all_results.extend(raw_data)
-                        
+
+                        # Search all categories in one provider round trip
+                        progress_text.text(f"Searching {len(search_categories)} categories...")
+                        all_results = collect_business_data_batched(
+                            api_type, search_categories, location
+                        )
+
                         if all_results:
                             # Clean and process the combined data
                             progress_text.text("Processing collected data...")
@@ -162,6 +199,12 @@ with st.sidebar:
                             # Add category information
                             processed_data['Primary Category'] = primary_category
                             processed_data['Search Category'] = processed_data['Business Type']
+
+                            # Extract city/state once so filtering doesn't
+                            # re-run the regex on every rerun
+                            processed_data['_CityState'] = processed_data['Address'].str.extract(
+                                _CITY_RE, expand=False
+                            )
                             
                             if not processed_data.empty:
                                 # Store in session state
@@ -175,11 +218,12 @@ with st.sidebar:
                                 # Show success message and category breakdown
                                 st.success(f"Found {len(processed_data)} businesses across {len(search_categories)} categories!")
                                 
-                                # Show category breakdown
-                                category_counts = processed_data['Search Category'].value_counts()
-                                st.markdown("### Results by Category:")
-                                for cat, count in category_counts.items():
-                                    st.markdown(f"- {cat}: {count} businesses")
+                                # Show category breakdown in one widget call
+                                category_counts = get_category_counts(processed_data)
+                                st.markdown("### Results by Category:\n" + "\n".join(
+                                    f"- {cat}: {count} businesses"
+                                    for cat, count in category_counts.items()
+                                ))
                             else:
                                 progress_text.empty()
                                 st.error("Error processing the collected data.")
@@ -213,7 +257,7 @@ if not df.empty:
     st.subheader("Filter Results")
     
     # Location filter
-    available_locations = sorted(df['Address'].str.extract(r'([\w\s]+,\s*\w{2})')[0].unique())
+    available_locations = get_locations(df)
     selected_location = st.multiselect(
         "Filter by Location",
         options=available_locations,
@@ -222,7 +266,7 @@ if not df.empty:
     )
     
     # Category filter
-    available_categories = sorted(df['Search Category'].unique())
+    available_categories = get_categories(df)
     selected_categories = st.multiselect(
         "Filter by Category",
         options=available_categories,
@@ -232,8 +276,8 @@ if not df.empty:
     
     # Apply filters
     filtered_df = df[
-        (df['Address'].str.extract(r'([\w\s]+,\s*\w{2})')[0].isin(selected_location)) &
-        (df['Search Category'].isin(selected_categories))
+        df['_CityState'].isin(set(selected_location)) &
+        df['Search Category'].isin(set(selected_categories))
     ]
     
     # Show results count
@@ -242,26 +286,15 @@ if not df.empty:
         
         # Category breakdown
         st.subheader("Available Listings by Category")
-        category_counts = filtered_df['Search Category'].value_counts()
-        
+        category_counts = get_category_counts(filtered_df)
+
         # Display category breakdown as a horizontal bar chart
-        fig = px.bar(
-            x=category_counts.values,
-            y=category_counts.index,
-            orientation='h',
-            title="Number of Listings by Category"
-        )
-        fig.update_layout(
-            xaxis_title="Number of Listings",
-            yaxis_title="Category",
-            showlegend=False
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(category_chart(category_counts), use_container_width=True)
         
         # Display the filtered data
         st.subheader("Available Listings")
         st.dataframe(
-            filtered_df,
+            filtered_df.drop(columns=['_CityState']),
             column_config={
                 "Business Name": st.column_config.TextColumn(
                     "Business Name",
@@ -305,10 +338,13 @@ if not df.empty:
         # Export options
         st.subheader("Export Results")
         if st.button("Download Results as CSV"):
-            csv = filtered_df.to_csv(index=False)
+            # Write straight to a bytes buffer so the payload is handed to
+            # the download button without a second str->bytes encode
+            buf = io.BytesIO()
+            filtered_df.drop(columns=['_CityState']).to_csv(buf, index=False)
             st.download_button(
                 label="Click to Download",
-                data=csv,
+                data=buf.getvalue(),
                 file_name=f"business_listings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv"
             )
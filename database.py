@@ -1,100 +1,199 @@
+import atexit
 import sqlite3
+import threading
+import time
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import logging
 
 class DatabaseManager:
     def __init__(self, db_path: str = "businesses.db"):
         self.db_path = db_path
+        # One shared connection instead of connect/close per call; sqlite3
+        # connections aren't thread-safe by default, so every access goes
+        # through the lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        atexit.register(self._conn.close)
         self.create_tables()
-    
+
     def create_tables(self):
         """Create the necessary database tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        
-        c.execute('''
-            CREATE TABLE IF NOT EXISTS businesses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                business_name TEXT,
-                address TEXT,
-                address_type TEXT,
-                phone TEXT,
-                rating REAL,
-                reviews INTEGER,
-                website TEXT,
-                business_type TEXT,
-                latitude REAL,
-                longitude REAL,
-                source TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-    
-    def save_businesses(self, businesses: List[Dict]):
-        """Save business data to the database"""
-        conn = sqlite3.connect(self.db_path)
-        
+        with self._lock:
+            c = self._conn.cursor()
+
+            # WAL avoids writer/reader blocking and NORMAL sync cuts fsync-bound
+            # write latency while staying crash-safe in WAL mode
+            c.execute('PRAGMA journal_mode=WAL')
+            c.execute('PRAGMA synchronous=NORMAL')
+
+            c.execute('''
+                CREATE TABLE IF NOT EXISTS businesses (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    business_name TEXT,
+                    address TEXT,
+                    address_type TEXT,
+                    phone TEXT,
+                    rating REAL,
+                    reviews INTEGER,
+                    website TEXT,
+                    business_type TEXT,
+                    latitude REAL,
+                    longitude REAL,
+                    source TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Indexes for the common filter/aggregation columns, plus a
+            # uniqueness constraint so repeated collection runs don't pile up
+            # duplicate rows
+            c.execute('CREATE INDEX IF NOT EXISTS idx_biz_type ON businesses(business_type)')
+            c.execute('CREATE INDEX IF NOT EXISTS idx_biz_source ON businesses(source)')
+            c.execute('CREATE INDEX IF NOT EXISTS idx_biz_created ON businesses(created_at DESC)')
+
+            # Databases written before the constraint existed hold duplicate
+            # rows (every collection run appended); building the unique index
+            # over them would raise IntegrityError, so collapse them to the
+            # oldest row first — only on the one startup where the index is
+            # still missing
+            if not c.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_biz_dedup'"
+            ).fetchone():
+                c.execute('''
+                    DELETE FROM businesses WHERE id NOT IN (
+                        SELECT MIN(id) FROM businesses
+                        GROUP BY business_name, address
+                    )
+                ''')
+            c.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_biz_dedup ON businesses(business_name, address)')
+
+            c.execute('''
+                CREATE TABLE IF NOT EXISTS geocode_cache (
+                    location TEXT PRIMARY KEY,
+                    lat REAL,
+                    lng REAL,
+                    ts INTEGER
+                )
+            ''')
+
+            c.execute('''
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    payload BLOB,
+                    created_at INTEGER
+                )
+            ''')
+
+            self._conn.commit()
+
+    def get_geocode(self, location: str, ttl: int = 86400) -> Optional[Tuple[float, float]]:
+        """Look up cached coordinates for a location, honoring the TTL"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT lat, lng FROM geocode_cache WHERE location = ? AND ts > ?',
+                (location, int(time.time()) - ttl)
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set_geocode(self, location: str, lat: float, lng: float):
+        """Store geocoded coordinates for a location"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO geocode_cache (location, lat, lng, ts) VALUES (?, ?, ?, ?)',
+                    (location, lat, lng, int(time.time()))
+                )
+
+    def get_cache(self, key: str, ttl: int = 3600) -> Optional[bytes]:
+        """Look up a cached payload by key, honoring the TTL"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT payload FROM cache WHERE key = ? AND created_at > ?',
+                (key, int(time.time()) - ttl)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_cache(self, key: str, payload: bytes):
+        """Store a serialized payload under the given cache key"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO cache (key, payload, created_at) VALUES (?, ?, ?)',
+                    (key, payload, int(time.time()))
+                )
+
+    def clear_database(self) -> None:
+        """Remove all stored businesses, e.g. ahead of a full refresh"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute('DELETE FROM businesses')
+
+    def save_businesses(self, businesses: List[Dict]) -> int:
+        """
+        Save business data to the database in one bulk transaction
+
+        Returns:
+            Number of rows actually inserted (duplicates are ignored)
+        """
+        rows = []
         for business in businesses:
             location = business.get('Location', {})
-            
-            try:
-                conn.execute('''
-                    INSERT INTO businesses (
-                        business_name, address, address_type, phone, rating, 
-                        reviews, website, business_type, latitude, longitude, source
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    business.get('Business Name', ''),
-                    business.get('Address', ''),
-                    business.get('Address Type', 'Unknown'),
-                    business.get('Phone', ''),
-                    business.get('Rating', 0.0),
-                    business.get('Reviews', 0),
-                    business.get('Website', ''),
-                    business.get('Business Type', ''),
-                    location.get('lat', 0),
-                    location.get('lng', 0),
-                    business.get('Source', '')
-                ))
-            except Exception as e:
-                logging.error(f"Error saving business: {str(e)}")
-                continue
-        
-        conn.commit()
-        conn.close()
-    
+            rows.append((
+                business.get('Business Name', ''),
+                business.get('Address', ''),
+                business.get('Address Type', 'Unknown'),
+                business.get('Phone', ''),
+                business.get('Rating', 0.0),
+                business.get('Reviews', 0),
+                business.get('Website', ''),
+                business.get('Business Type', ''),
+                location.get('lat', 0),
+                location.get('lng', 0),
+                business.get('Source', '')
+            ))
+
+        try:
+            # Single executemany in one transaction instead of per-row execute
+            with self._lock:
+                with self._conn:
+                    cursor = self._conn.executemany('''
+                        INSERT OR IGNORE INTO businesses (
+                            business_name, address, address_type, phone, rating,
+                            reviews, website, business_type, latitude, longitude, source
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', rows)
+                    return max(cursor.rowcount, 0)
+        except Exception as e:
+            logging.error(f"Error saving businesses: {str(e)}")
+            return 0
+
     def get_businesses(self) -> pd.DataFrame:
         """Retrieve all businesses from the database"""
-        conn = sqlite3.connect(self.db_path)
-        
-        df = pd.read_sql_query('''
-            SELECT 
-                business_name as "Business Name",
-                address as "Address",
-                address_type as "Address Type",
-                phone as "Phone",
-                rating as "Rating",
-                reviews as "Reviews",
-                website as "Website",
-                business_type as "Business Type",
-                latitude,
-                longitude,
-                source as "Source"
-            FROM businesses
-        ''', conn)
-        
-        # Create Location column
-        df['Location'] = df.apply(
-            lambda row: {'lat': row['latitude'], 'lng': row['longitude']},
-            axis=1
-        )
-        
-        # Drop individual lat/lng columns
-        df = df.drop(['latitude', 'longitude'], axis=1)
-        
-        conn.close()
+        with self._lock:
+            df = pd.read_sql_query('''
+                SELECT
+                    business_name as "Business Name",
+                    address as "Address",
+                    address_type as "Address Type",
+                    phone as "Phone",
+                    rating as "Rating",
+                    reviews as "Reviews",
+                    website as "Website",
+                    business_type as "Business Type",
+                    latitude,
+                    longitude,
+                    source as "Source"
+                FROM businesses
+            ''', self._conn, dtype_backend='pyarrow')
+
+        # Create Location column from the raw arrays; a plain comprehension
+        # over zipped values avoids apply's per-row Series construction.
+        # The flat latitude/longitude columns stay alongside it so the map
+        # code can read contiguous arrays, matching clean_data's layout.
+        df['Location'] = [
+            {'lat': lat, 'lng': lng}
+            for lat, lng in zip(df['latitude'].tolist(), df['longitude'].tolist())
+        ]
+
         return df
@@ -1,4 +1,8 @@
-from apscheduler.schedulers.background import BackgroundScheduler
+import asyncio
+import itertools
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
 from utils import DataCollector, merge_data_sources
@@ -11,28 +15,75 @@ from dotenv import load_dotenv
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Jobs in the persistent store must be picklable, and a bound method drags
+# its whole instance — scheduler, DB connection, lock, HTTP sessions — into
+# the pickle, which fails at start(). Jobs are therefore registered as
+# textual references to these module-level functions, which look up the
+# running scheduler instance at call time.
+_active_scheduler = None
+
+async def run_daily_update():
+    """Entry point for the persisted daily update job"""
+    if _active_scheduler is not None:
+        await _active_scheduler.update_data()
+
+async def run_weekly_refresh():
+    """Entry point for the persisted weekly refresh job"""
+    if _active_scheduler is not None:
+        await _active_scheduler.full_refresh()
+
 class DataUpdateScheduler:
+    # Rows per save_businesses call; keeps the row-tuple list the writer
+    # materializes (and the transaction it runs) to a bounded size
+    _SAVE_CHUNK = 10000
+
     def __init__(self, db_manager: DatabaseManager):
-        self.scheduler = BackgroundScheduler()
+        # AsyncIOScheduler awaits coroutine jobs on the event loop;
+        # BackgroundScheduler would just create un-awaited coroutine objects
+        # and silently never run them. The hosting process must keep an
+        # asyncio event loop running (e.g. asyncio.get_event_loop().run_forever()).
+        #
+        # Jobs persist in a SQLAlchemy-backed store so schedules survive
+        # restarts. coalesce folds a backlog of missed runs into one, and
+        # max_instances stops a slow update from overlapping with the next
+        # trigger; misfires older than an hour are dropped instead of fired.
+        self.scheduler = AsyncIOScheduler(
+            jobstores={
+                'default': SQLAlchemyJobStore(
+                    url=os.getenv('DATABASE_URL', 'sqlite:///scheduler_jobs.db')
+                )
+            },
+            job_defaults={
+                'coalesce': True,
+                'max_instances': 1,
+                'misfire_grace_time': 3600
+            }
+        )
         self.db_manager = db_manager
         self.collector = DataCollector(google_api_key=os.getenv('GOOGLE_MAPS_API_KEY', ''))
+        # Read once here rather than per business type per run; environment
+        # lookups walk os.environ and the key doesn't change mid-process
+        self._has_google_key = bool(self.collector.google_api_key)
         self.business_types = ["Marketing Firms", "Lawyers", "Paralegal"]
         self.default_location = "Oakland County, Michigan"
 
     def start(self):
         """Start the scheduler with predefined jobs"""
+        global _active_scheduler
+        _active_scheduler = self
+
         # Schedule daily update at 2 AM
         self.scheduler.add_job(
-            self.update_data,
+            'scheduler:run_daily_update',
             trigger=CronTrigger(hour=2),
             id='daily_update',
             name='Daily data update',
             replace_existing=True
         )
-        
+
         # Schedule weekly full refresh on Sunday at 3 AM
         self.scheduler.add_job(
-            self.full_refresh,
+            'scheduler:run_weekly_refresh',
             trigger=CronTrigger(day_of_week='sun', hour=3),
             id='weekly_refresh',
             name='Weekly full refresh',
@@ -47,27 +98,58 @@ class DataUpdateScheduler:
         self.scheduler.shutdown()
         logger.info("Scheduler stopped")
 
+    async def _collect(self, business_type: str) -> list:
+        """Collect and merge one business type from both sources"""
+        yelp_data = await self.collector.scrape_yelp_async(business_type, self.default_location)
+        google_data = []
+
+        if self._has_google_key:
+            google_data = await self.collector.get_google_places_data_async(
+                business_type,
+                self.default_location
+            )
+
+        return merge_data_sources(yelp_data, google_data)
+
     async def update_data(self):
         """Update data for all business types"""
         try:
             logger.info(f"Starting scheduled data update at {datetime.now()}")
+
+            # All business types are collected concurrently over the
+            # collector's shared connection pool; the run takes roughly as
+            # long as the slowest single type instead of the sum of them
+            results = await asyncio.gather(
+                *(self._collect(business_type) for business_type in self.business_types),
+                return_exceptions=True
+            )
+
             all_data = []
-            
-            for business_type in self.business_types:
-                yelp_data = self.collector.scrape_yelp(business_type, self.default_location)
-                google_data = []
-                
-                if os.getenv('GOOGLE_MAPS_API_KEY'):
-                    google_data = self.collector.get_google_places_data(
-                        business_type, 
-                        self.default_location
-                    )
-                
-                merged_data = merge_data_sources(yelp_data, google_data)
-                all_data.extend(merged_data)
-            
-            if all_data:
-                saved_count = self.db_manager.save_businesses(all_data)
+            for business_type, result in zip(self.business_types, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error collecting {business_type}: {str(result)}")
+                else:
+                    all_data.extend(result)
+
+            # Drop in-batch duplicates before touching the database; the
+            # unique index would reject them anyway, but filtering here in a
+            # dict keyed on (name, address) skips the wasted insert attempts
+            unique_data = {
+                (business.get('Business Name', '').lower(),
+                 business.get('Address', '').lower()): business
+                for business in all_data
+            }
+
+            if unique_data:
+                # Feed the writer in slices instead of one giant batch so
+                # peak memory past this point is O(chunk), not O(total)
+                saved_count = 0
+                rows = iter(unique_data.values())
+                while True:
+                    chunk = list(itertools.islice(rows, self._SAVE_CHUNK))
+                    if not chunk:
+                        break
+                    saved_count += self.db_manager.save_businesses(chunk)
                 logger.info(f"Successfully updated {saved_count} records")
             else:
                 logger.warning("No new data collected during update")
